@@ -5,10 +5,328 @@ This module contains the AIPlayer class that implements different strategies
 for the computer opponent: Easy (random), Medium (basic strategy), and Hard (minimax).
 """
 
+import mmap
+import os
 import random
-from typing import Tuple, Optional
+import threading
+from typing import Dict, List, Tuple, Optional, Union
 from enum import Enum
-from game_logic import GameBoard, Player, GameState
+from game_logic import GameBoard, Player, SYMMETRIES, WIN_MASKS, encode_masks
+from ai_player_core import FULL, NUMBA_AVAILABLE, solve
+from ai_player_core import has_won, has_winning_move
+from ai_player_core import ORDER_BITS as _ORDER_BITS, O as _O, WIN as _WIN, X as _X
+
+# Center and corner cells, counted by the heuristic for cut-off positions
+_STRONG = 0b101010101
+
+# A win (_WIN) outscores any heuristic value; _INF is outside the range of
+# any real score
+_INF = _WIN + 1
+
+# Transposition table entry flags: the stored score is exact, or only a
+# lower/upper bound because the search that produced it was cut off.
+_EXACT = 0
+_LOWER_BOUND = 1
+_UPPER_BOUND = 2
+
+# Zobrist keys: one random 64-bit value per (cell, contents) with contents
+# _EMPTY, X or O, plus one for the side to move. A position's hash is the
+# XOR of the keys that apply, so a move updates it with a single XOR.
+_EMPTY, _PIECE_X, _PIECE_O = 0, 1, 2
+_zobrist_random = random.Random(0)
+ZKEYS = [[_zobrist_random.getrandbits(64) for _ in range(3)] for _ in range(9)]
+ZTURN = _zobrist_random.getrandbits(64)
+
+# The search hashes a position once per board symmetry, as if the board had
+# been transformed first; the smallest of the eight hashes is the same for
+# every rotation and reflection of a position. _ZMOVE gives the change to
+# each of the eight hashes when a side places a piece on a cell bit.
+_ZMOVE = tuple(
+    {1 << sq: tuple(ZKEYS[sym[sq]][_EMPTY] ^ ZKEYS[sym[sq]][piece] ^ ZTURN
+                    for sym in SYMMETRIES)
+     for sq in range(9)}
+    for piece in (_PIECE_X, _PIECE_O)
+)
+# Cell bit mappings into and out of each symmetry's frame
+_SYM_BITS = tuple({1 << sq: 1 << sym[sq] for sq in range(9)} for sym in SYMMETRIES)
+_INV_SYM_BITS = tuple({1 << sym[sq]: 1 << sq for sq in range(9)} for sym in SYMMETRIES)
+
+# Search results keyed by the smallest symmetric Zobrist hash, shared by all
+# players. Entries are (score, flag, depth searched, best move bit), with the
+# move bit in the frame of the symmetry that produced the key.
+_TT: Dict[int, Tuple[int, int, int, int]] = {}
+
+# Optimal move for every position reachable in normal play, as one byte per
+# base-3 board encoding (game_logic.encode_masks) holding row * 3 + col, or
+# _NO_MOVE. The file next to this module is memory-mapped read-only, so every
+# worker process shares the same page-cache copy; it ends with a version byte.
+_POLICY: Optional[Union[mmap.mmap, bytes]] = None
+_POLICY_LOCK = threading.Lock()
+_POLICY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "best_move.bin")
+_POLICY_SIZE = 3 ** 9
+_POLICY_VERSION = 6
+_NO_MOVE = 255
+
+
+def _zobrist(x_mask: int, o_mask: int, to_move: int) -> Tuple[int, ...]:
+    """Compute a position's Zobrist hash under each board symmetry from scratch."""
+    zhashes = []
+    for sym in SYMMETRIES:
+        zhash = ZTURN if to_move == _O else 0
+        for sq in range(9):
+            bit = 1 << sq
+            if x_mask & bit:
+                zhash ^= ZKEYS[sym[sq]][_PIECE_X]
+            elif o_mask & bit:
+                zhash ^= ZKEYS[sym[sq]][_PIECE_O]
+            else:
+                zhash ^= ZKEYS[sym[sq]][_EMPTY]
+        zhashes.append(zhash)
+    return tuple(zhashes)
+
+
+def _popcount(mask: int) -> int:
+    """Count the set bits in a bitboard."""
+    return bin(mask).count("1")
+
+
+def _heuristic(x_mask: int, o_mask: int, to_move: int) -> int:
+    """Score a cut-off position by center and corner control for the side to move."""
+    score = _popcount(x_mask & _STRONG) - _popcount(o_mask & _STRONG)
+    return score if to_move == _X else -score
+
+
+def _search(x_mask: int, o_mask: int, to_move: int, zhashes: Tuple[int, ...],
+            depth: int, alpha: int, beta: int) -> int:
+    """
+    Depth-limited negamax search with alpha-beta pruning over bitboards.
+    
+    Args:
+        x_mask: Bit i set if X occupies cell i (row * 3 + col)
+        o_mask: Bit i set if O occupies cell i
+        to_move: _X or _O, the side to move
+        zhashes: Zobrist hashes of the position under each symmetry,
+            updated incrementally per move
+        depth: Plies left to search before falling back to _heuristic
+        alpha: Best score the side to move is already assured of
+        beta: Best score the opponent is already assured of
+        
+    Returns:
+        Score from the side to move's point of view (_WIN, 0, -_WIN for a
+        solved position, or a heuristic value in between)
+    """
+    # Only the player who just moved can have completed a line
+    if has_won(o_mask if to_move == _X else x_mask):
+        return -_WIN
+    empty = ~(x_mask | o_mask) & FULL
+    if not empty:
+        return 0
+    # A side that can complete a line now wins; no sibling can do better
+    if has_winning_move(x_mask if to_move == _X else o_mask, empty):
+        return _WIN
+    # Searching deeper than the remaining empty cells changes nothing, so
+    # clamp and let entries searched to the end serve every later depth
+    depth = min(depth, _popcount(empty))
+    if depth == 0:
+        return _heuristic(x_mask, o_mask, to_move)
+    
+    # Reuse the score of a position (or a rotation or reflection of it)
+    # already searched at least this deep, and try its best move first
+    zkey = min(zhashes)
+    sym = zhashes.index(zkey)
+    entry = _TT.get(zkey)
+    pv_bit = 0
+    if entry is not None:
+        value, flag, entry_depth, pv_bit = entry
+        if pv_bit:
+            pv_bit = _INV_SYM_BITS[sym][pv_bit]
+        if entry_depth >= depth:
+            if flag == _EXACT:
+                return value
+            if flag == _LOWER_BOUND:
+                alpha = max(alpha, value)
+            else:
+                beta = min(beta, value)
+            if alpha >= beta:
+                return value
+    alpha_orig, beta_orig = alpha, beta
+    
+    best_score = -_INF
+    best_bit = 0
+    zmove = _ZMOVE[to_move]
+    for bit in (pv_bit,) + _ORDER_BITS if pv_bit else _ORDER_BITS:
+        if not empty & bit:
+            continue
+        empty ^= bit  # Skip the PV move when it comes round again in _ORDER_BITS
+        child_hashes = tuple(h ^ d for h, d in zip(zhashes, zmove[bit]))
+        if to_move == _X:
+            score = -_search(x_mask | bit, o_mask, _O, child_hashes, depth - 1, -beta, -alpha)
+        else:
+            score = -_search(x_mask, o_mask | bit, _X, child_hashes, depth - 1, -beta, -alpha)
+        if score > best_score:
+            best_score = score
+            best_bit = bit
+        alpha = max(alpha, best_score)
+        if alpha >= beta:
+            break
+    
+    if best_score <= alpha_orig:
+        flag = _UPPER_BOUND
+    elif best_score >= beta_orig:
+        flag = _LOWER_BOUND
+    else:
+        flag = _EXACT
+    _TT[zkey] = (best_score, flag, depth, _SYM_BITS[sym][best_bit])
+    return best_score
+
+
+def _best_move(x_mask: int, o_mask: int, to_move: int) -> Optional[Tuple[int, int]]:
+    """
+    Find the best (row, col) for the side to move by iterative deepening.
+    
+    Each pass searches one ply deeper than the last and tries the previous
+    pass's best move first; the final pass reaches the end of the game.
+    When Numba is available the compiled core solves each reply outright
+    instead, which is faster than any amount of pruning in Python.
+    """
+    if NUMBA_AVAILABLE:
+        empty = ~(x_mask | o_mask) & FULL
+        best_score = -_INF
+        best_bit = 0
+        for bit in _ORDER_BITS:
+            if not empty & bit:
+                continue
+            if to_move == _X:
+                score = -solve(x_mask | bit, o_mask, _O, -_INF, -best_score)
+            else:
+                score = -solve(x_mask, o_mask | bit, _X, -_INF, -best_score)
+            if score > best_score:
+                best_score = score
+                best_bit = bit
+        return divmod(best_bit.bit_length() - 1, 3) if best_bit else None
+    
+    zhashes = _zobrist(x_mask, o_mask, to_move)
+    zmove = _ZMOVE[to_move]
+    pv_bit = 0
+    for depth in range(1, _popcount(~(x_mask | o_mask) & FULL) + 1):
+        empty = ~(x_mask | o_mask) & FULL
+        best_score = -_INF
+        best_bit = 0
+        
+        for bit in (pv_bit,) + _ORDER_BITS if pv_bit else _ORDER_BITS:
+            if not empty & bit:
+                continue
+            empty ^= bit
+            # Score the reply from the opponent's point of view, using the
+            # best score so far as alpha
+            child_hashes = tuple(h ^ d for h, d in zip(zhashes, zmove[bit]))
+            if to_move == _X:
+                score = -_search(x_mask | bit, o_mask, _O, child_hashes,
+                                 depth - 1, -_INF, -best_score)
+            else:
+                score = -_search(x_mask, o_mask | bit, _X, child_hashes,
+                                 depth - 1, -_INF, -best_score)
+            
+            if score > best_score:
+                best_score = score
+                best_bit = bit
+        pv_bit = best_bit
+    
+    return divmod(pv_bit.bit_length() - 1, 3) if pv_bit else None
+
+
+def _build_policy() -> Dict[Tuple[int, int, int], Tuple[int, int]]:
+    """Solve every position reachable from the empty board, X moving first."""
+    policy = {}
+    frontier = [(0, 0, _X)]
+    while frontier:
+        next_frontier = set()
+        for x_mask, o_mask, to_move in frontier:
+            if has_won(x_mask) or has_won(o_mask):
+                continue
+            empty = ~(x_mask | o_mask) & FULL
+            if not empty:
+                continue
+            policy[(x_mask, o_mask, to_move)] = _best_move(x_mask, o_mask, to_move)
+            while empty:
+                bit = empty & -empty
+                empty ^= bit
+                if to_move == _X:
+                    next_frontier.add((x_mask | bit, o_mask, _O))
+                else:
+                    next_frontier.add((x_mask, o_mask | bit, _X))
+        frontier = next_frontier
+    return policy
+
+
+def _policy_table() -> bytes:
+    """Solve every reachable position into the flat table and version byte."""
+    table = bytearray([_NO_MOVE]) * _POLICY_SIZE
+    for (x_mask, o_mask, _), (row, col) in _build_policy().items():
+        table[encode_masks(x_mask, o_mask)] = row * 3 + col
+    table.append(_POLICY_VERSION)
+    return bytes(table)
+
+
+def _write_policy_file(table: bytes, path: str):
+    """Write the table, replacing path atomically so readers never see part of it."""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(table)
+    os.replace(tmp_path, path)
+
+
+def build_policy_file(path: str = _POLICY_PATH):
+    """
+    Build the policy table and write it to disk.
+    
+    Run offline (see build_policy.py) so deployed workers only map the file.
+    
+    Args:
+        path: File to write
+    """
+    _write_policy_file(_policy_table(), path)
+
+
+def _map_policy_file() -> Optional[mmap.mmap]:
+    """Memory-map the policy file read-only, or None if missing or stale."""
+    try:
+        with open(_POLICY_PATH, "rb") as f:
+            table = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    if len(table) != _POLICY_SIZE + 1 or table[_POLICY_SIZE] != _POLICY_VERSION:
+        table.close()
+        return None
+    return table
+
+
+def load_policy() -> Union[mmap.mmap, bytes]:
+    """
+    Return the minimax policy table, mapping or building it on first use.
+    
+    Returns:
+        Buffer indexed by base-3 board encoding, each byte the best cell
+        (row * 3 + col) for the side to move or _NO_MOVE
+    """
+    global _POLICY
+    if _POLICY is not None:
+        return _POLICY
+    
+    with _POLICY_LOCK:
+        if _POLICY is None:
+            policy = _map_policy_file()
+            if policy is None:
+                table = _policy_table()
+                try:
+                    _write_policy_file(table, _POLICY_PATH)
+                    policy = _map_policy_file()
+                except OSError:
+                    pass
+                if policy is None:
+                    policy = table  # Read-only install; rebuild next time
+            _POLICY = policy
+    return _POLICY
 
 
 class Difficulty(Enum):
@@ -68,16 +386,18 @@ class AIPlayer:
         3. Take center if available
         4. Random move
         """
+        lines = self._scan_lines(board)
+        opponent = "O" if self.player == Player.X else "X"
+        
         # Try to win
-        win_move = self._find_winning_move(board, self.player.value)
-        if win_move:
-            return win_move
+        win_cells = lines[f"{self.player.value}_win_cells"]
+        if win_cells:
+            return win_cells[0]
         
         # Block opponent win
-        opponent = "O" if self.player == Player.X else "X"
-        block_move = self._find_winning_move(board, opponent)
-        if block_move:
-            return block_move
+        block_cells = lines[f"{opponent}_win_cells"]
+        if block_cells:
+            return block_cells[0]
         
         # Take center if available
         if board.is_valid_move(1, 1):
@@ -87,62 +407,48 @@ class AIPlayer:
         return self._get_random_move(board)
     
     def _get_minimax_move(self, board: GameBoard) -> Tuple[int, int]:
-        """Get optimal move using minimax algorithm."""
-        best_score = float('-inf')
-        best_move = None
-        
-        for row, col in board.get_empty_cells():
-            # Make temporary move
-            board_copy = board.copy()
-            board_copy.board[row][col] = self.player.value
-            
-            # Get minimax score
-            score = self._minimax(board_copy, False)
-            
-            if score > best_score:
-                best_score = score
-                best_move = (row, col)
-        
-        return best_move
+        """Get optimal move from the precomputed minimax policy."""
+        x_mask, o_mask = board.x_mask, board.o_mask
+        to_move = _X if self.player == Player.X else _O
+        # The table assumes X moved first, so it only applies when the piece
+        # counts agree that it is this player's turn
+        x_count, o_count = _popcount(x_mask), _popcount(o_mask)
+        if x_count - o_count == (0 if to_move == _X else 1):
+            cell = load_policy()[board.encode()]
+            if cell != _NO_MOVE:
+                return divmod(cell, 3)
+        # Positions outside normal play (e.g. set up by hand) are searched
+        return _best_move(x_mask, o_mask, to_move)
     
-    def _minimax(self, board: GameBoard, is_maximizing: bool) -> int:
+    def _scan_lines(self, board: GameBoard) -> Dict[str, List[Tuple[int, int]]]:
         """
-        Minimax algorithm implementation.
+        Classify every line once, finding the cells that win for each player.
         
         Args:
             board: Current board state
-            is_maximizing: True if maximizing player's turn
             
         Returns:
-            Score for this board state
+            Dict with "X_win_cells" and "O_win_cells" lists of (row, col)
         """
-        state = board.get_game_state()
+        lines = {"X_win_cells": [], "O_win_cells": []}
+        x_mask, o_mask = board.x_mask, board.o_mask
+        # No line can hold two of one player's pieces before the third move
+        if _popcount(x_mask | o_mask) < 3:
+            return lines
         
-        # Terminal states
-        if state == GameState.X_WINS:
-            return 1 if self.player == Player.X else -1
-        elif state == GameState.O_WINS:
-            return 1 if self.player == Player.O else -1
-        elif state == GameState.DRAW:
-            return 0
+        empty = ~(x_mask | o_mask) & FULL
+        for line_mask in WIN_MASKS:
+            free = line_mask & empty
+            # Exactly one cell of the line is free
+            if free == 0 or free & (free - 1):
+                continue
+            cell = divmod(free.bit_length() - 1, 3)
+            if x_mask & line_mask == line_mask ^ free:
+                lines["X_win_cells"].append(cell)
+            elif o_mask & line_mask == line_mask ^ free:
+                lines["O_win_cells"].append(cell)
         
-        if is_maximizing:
-            max_score = float('-inf')
-            for row, col in board.get_empty_cells():
-                board_copy = board.copy()
-                board_copy.board[row][col] = self.player.value
-                score = self._minimax(board_copy, False)
-                max_score = max(score, max_score)
-            return max_score
-        else:
-            min_score = float('inf')
-            opponent = "O" if self.player == Player.X else "X"
-            for row, col in board.get_empty_cells():
-                board_copy = board.copy()
-                board_copy.board[row][col] = opponent
-                score = self._minimax(board_copy, True)
-                min_score = min(score, min_score)
-            return min_score
+        return lines
     
     def _find_winning_move(self, board: GameBoard, player_symbol: str) -> Optional[Tuple[int, int]]:
         """
@@ -155,15 +461,5 @@ class AIPlayer:
         Returns:
             Winning move coordinates or None if no winning move exists
         """
-        for row, col in board.get_empty_cells():
-            # Try the move
-            board_copy = board.copy()
-            board_copy.board[row][col] = player_symbol
-            
-            # Check if it's a winning move
-            state = board_copy.get_game_state()
-            if ((player_symbol == "X" and state == GameState.X_WINS) or
-                (player_symbol == "O" and state == GameState.O_WINS)):
-                return (row, col)
-        
-        return None
\ No newline at end of file
+        win_cells = self._scan_lines(board)[f"{player_symbol}_win_cells"]
+        return win_cells[0] if win_cells else None
@@ -0,0 +1,103 @@
+"""
+Bitboard search core for the hard AI.
+
+This module holds the integer-only part of the minimax search so it can be
+compiled with Numba when it is installed. Without Numba the same functions
+run as plain Python.
+"""
+
+from game_logic import FULL_MASK, WIN_MASKS
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that leaves the function uncompiled."""
+        def decorator(func):
+            return func
+        return decorator
+
+
+# Bitboard layout: bit (row * 3 + col) is set when that cell is occupied.
+# WINS holds the three rows, three columns and two diagonals.
+WINS = WIN_MASKS
+FULL = FULL_MASK
+
+# Cells in the order the search tries them: center, corners, then edges.
+# Strong moves first lets alpha-beta cut off more of the tree.
+ORDER = ((1, 1), (0, 0), (0, 2), (2, 0), (2, 2), (0, 1), (1, 0), (1, 2), (2, 1))
+ORDER_BITS = tuple(1 << (row * 3 + col) for row, col in ORDER)
+
+# Side-to-move indices
+X = 0
+O = 1
+
+# Score of a won position for the side that won
+WIN = 10
+
+
+@njit('boolean(int32)', cache=True)
+def has_won(mask):
+    """Check whether a player's bitboard contains a complete line."""
+    for w in WINS:
+        if (mask & w) == w:
+            return True
+    return False
+
+
+@njit('boolean(int32,int32)', cache=True)
+def has_winning_move(mask, empty):
+    """Check whether a player can complete a line by taking one empty cell."""
+    for w in WINS:
+        missing = w & ~mask
+        # Exactly one cell of the line is missing, and it is free
+        if missing != 0 and (missing & (missing - 1)) == 0 and (missing & empty) != 0:
+            return True
+    return False
+
+
+# Not cached on disk: loading a cached build of this self-recursive function
+# crashes every process after the one that compiled it
+@njit('int8(int32,int32,int8,int8,int8)')
+def solve(x_mask, o_mask, to_move, alpha, beta):
+    """
+    Solve a position with negamax alpha-beta search to the end of the game.
+    
+    Args:
+        x_mask: Bit i set if X occupies cell i (row * 3 + col)
+        o_mask: Bit i set if O occupies cell i
+        to_move: X or O, the side to move
+        alpha: Best score the side to move is already assured of
+        beta: Best score the opponent is already assured of
+    
+    Returns:
+        WIN, 0 or -WIN from the side to move's point of view
+    """
+    # Only the player who just moved can have completed a line
+    if has_won(o_mask if to_move == X else x_mask):
+        return -WIN
+    empty = ~(x_mask | o_mask) & FULL
+    if empty == 0:
+        return 0
+    # A side that can complete a line now wins; no sibling can do better
+    if has_winning_move(x_mask if to_move == X else o_mask, empty):
+        return WIN
+    
+    best_score = -WIN - 1
+    for bit in ORDER_BITS:
+        if empty & bit == 0:
+            continue
+        if to_move == X:
+            score = -solve(x_mask | bit, o_mask, O, -beta, -alpha)
+        else:
+            score = -solve(x_mask, o_mask | bit, X, -beta, -alpha)
+        if score > best_score:
+            best_score = score
+        if best_score > alpha:
+            alpha = best_score
+        if alpha >= beta:
+            break
+    return best_score
@@ -1,5 +1,8 @@
 """
 Production entry point for deployment platforms.
+
+Serve with gunicorn (see Procfile); running this file directly starts
+Flask's development server instead.
 """
 
 from web_app import app
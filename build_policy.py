@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""
+Build the hard AI's precomputed move table.
+
+Writes best_move.bin next to ai_player.py (or to the given path). Run this
+once at build time so server workers only memory-map the file at startup
+instead of each solving the game.
+"""
+
+import sys
+import time
+from ai_player import build_policy_file
+
+
+def main():
+    """Build the table and report where it was written."""
+    start = time.perf_counter()
+    if len(sys.argv) > 1:
+        build_policy_file(sys.argv[1])
+        path = sys.argv[1]
+    else:
+        build_policy_file()
+        path = "best_move.bin"
+    print(f"Wrote {path} in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -6,6 +6,7 @@ user-friendly prompts for an engaging game experience.
 """
 
 import os
+import sys
 from typing import Tuple
 from game_logic import GameBoard, GameState, Player
 from ai_player import AIPlayer, Difficulty
@@ -32,6 +33,15 @@ class CLIInterface:
     and managing the game flow with colored output.
     """
     
+    # Colored cell symbols and separators, built once for display_board
+    _SYMS = {
+        "X": f"{Colors.RED}{Colors.BOLD}X{Colors.END}",
+        "O": f"{Colors.BLUE}{Colors.BOLD}O{Colors.END}",
+        None: " ",
+    }
+    _SEP = f"{Colors.WHITE} | {Colors.END}"
+    _ROW_SEP = f"{Colors.WHITE}  ---|---|---{Colors.END}"
+    
     def __init__(self):
         """Initialize the CLI interface."""
         self.board = GameBoard()
@@ -40,7 +50,13 @@ class CLIInterface:
     
     def clear_screen(self):
         """Clear the terminal screen."""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        if os.name == 'nt' and 'WT_SESSION' not in os.environ:
+            # Legacy Windows consoles may not understand ANSI escapes
+            os.system('cls')
+        else:
+            # Home the cursor, then clear the screen and the scrollback
+            sys.stdout.write('\033[H\033[2J\033[3J')
+            sys.stdout.flush()
     
     def display_title(self):
         """Display the game title."""
@@ -55,26 +71,17 @@ class CLIInterface:
     
     def display_board(self):
         """Display the current game board with colors."""
-        print(f"\n{Colors.BOLD}Current Board:{Colors.END}")
-        print(f"{Colors.YELLOW}   0   1   2{Colors.END}")
+        parts = [f"\n{Colors.BOLD}Current Board:{Colors.END}",
+                 f"{Colors.YELLOW}   0   1   2{Colors.END}"]
         
         for i, row in enumerate(self.board.board):
-            row_display = f"{Colors.YELLOW}{i}{Colors.END}  "
-            for j, cell in enumerate(row):
-                if cell == "X":
-                    symbol = f"{Colors.RED}{Colors.BOLD}X{Colors.END}"
-                elif cell == "O":
-                    symbol = f"{Colors.BLUE}{Colors.BOLD}O{Colors.END}"
-                else:
-                    symbol = " "
-                
-                row_display += symbol
-                if j < 2:
-                    row_display += f"{Colors.WHITE} | {Colors.END}"
-            
-            print(row_display)
+            parts.append(f"{Colors.YELLOW}{i}{Colors.END}  "
+                         + self._SEP.join([self._SYMS[cell] for cell in row]))
             if i < 2:
-                print(f"{Colors.WHITE}  ---|---|---{Colors.END}")
+                parts.append(self._ROW_SEP)
+        
+        # Write the whole frame in one call
+        sys.stdout.write("\n".join(parts) + "\n")
     
     def get_game_mode(self) -> str:
         """Get the game mode from user."""
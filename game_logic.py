@@ -5,7 +5,7 @@ This module contains the GameBoard class that manages the game state,
 validates moves, and checks for win conditions.
 """
 
-from typing import List, Optional, Tuple
+from typing import Iterator, List, Optional, Tuple
 from enum import Enum
 
 
@@ -23,19 +23,85 @@ class GameState(Enum):
     DRAW = "draw"
 
 
+# Flat cell indices (row * 3 + col) of the three rows, three columns and
+# two diagonals
+LINES = ((0, 1, 2), (3, 4, 5), (6, 7, 8),
+         (0, 3, 6), (1, 4, 7), (2, 5, 8),
+         (0, 4, 8), (2, 4, 6))
+
+# The eight symmetries of the board (rotations and reflections) as flat
+# index permutations: SYMMETRIES[s][i] is the cell that cell i moves to
+SYMMETRIES = (
+    (0, 1, 2, 3, 4, 5, 6, 7, 8),  # Identity
+    (2, 5, 8, 1, 4, 7, 0, 3, 6),  # Rotate 90 clockwise
+    (8, 7, 6, 5, 4, 3, 2, 1, 0),  # Rotate 180
+    (6, 3, 0, 7, 4, 1, 8, 5, 2),  # Rotate 270 clockwise
+    (2, 1, 0, 5, 4, 3, 8, 7, 6),  # Mirror left-right
+    (0, 3, 6, 1, 4, 7, 2, 5, 8),  # Mirror along the main diagonal
+    (6, 7, 8, 3, 4, 5, 0, 1, 2),  # Mirror top-bottom
+    (8, 5, 2, 7, 4, 1, 6, 3, 0),  # Mirror along the anti-diagonal
+)
+
+# The same lines as bitmasks over bit (row * 3 + col), and for each cell
+# the masks of the lines passing through it
+WIN_MASKS = tuple(sum(1 << i for i in line) for line in LINES)
+WIN_MASKS_FOR_CELL = tuple(tuple(m for m in WIN_MASKS if m & (1 << i)) for i in range(9))
+FULL_MASK = 0x1FF
+
+# Place values of each flat cell index in encode_masks()
+POW3 = tuple(3 ** i for i in range(9))
+
+
+def encode_masks(x_mask: int, o_mask: int) -> int:
+    """
+    Pack a position into a base-3 integer.
+    
+    Args:
+        x_mask: Bit (row * 3 + col) set for each cell X occupies
+        o_mask: Bit (row * 3 + col) set for each cell O occupies
+        
+    Returns:
+        Sum over cells of 3 ** (row * 3 + col) times 0 (empty), 1 (X) or 2 (O)
+    """
+    code = 0
+    for i in range(9):
+        bit = 1 << i
+        if x_mask & bit:
+            code += POW3[i]
+        elif o_mask & bit:
+            code += 2 * POW3[i]
+    return code
+
+
 class GameBoard:
     """
     Manages the Tic Tac Toe game board and game state.
     
+    Each player's pieces are kept as a bitboard and the game state is tracked
+    incrementally from them. The board grid is a read-only view built from
+    the bitboards, so make_move/unmake_move are the only ways to change it.
+    
     Attributes:
-        board: 3x3 grid representing the game board
+        board: 3x3 grid representing the game board (read-only)
         current_player: The player whose turn it is
+        x_mask: Bit (row * 3 + col) set for each cell X occupies
+        o_mask: Bit (row * 3 + col) set for each cell O occupies
     """
     
     def __init__(self):
         """Initialize an empty 3x3 game board."""
-        self.board: List[List[Optional[str]]] = [[None for _ in range(3)] for _ in range(3)]
         self.current_player = Player.X
+        self.x_mask = 0
+        self.o_mask = 0
+        self._state = GameState.ONGOING
+    
+    @property
+    def board(self) -> Tuple[Tuple[Optional[str], ...], ...]:
+        """The grid as three rows of "X", "O" or None, built from the bitboards."""
+        x_mask, o_mask = self.x_mask, self.o_mask
+        cells = tuple("X" if x_mask >> i & 1 else "O" if o_mask >> i & 1 else None
+                      for i in range(9))
+        return (cells[0:3], cells[3:6], cells[6:9])
     
     def make_move(self, row: int, col: int) -> bool:
         """
@@ -51,61 +117,93 @@ class GameBoard:
         if not self.is_valid_move(row, col):
             return False
         
-        self.board[row][col] = self.current_player.value
+        cell = row * 3 + col
+        if self.current_player == Player.X:
+            self.x_mask |= 1 << cell
+            mask, win_state = self.x_mask, GameState.X_WINS
+        else:
+            self.o_mask |= 1 << cell
+            mask, win_state = self.o_mask, GameState.O_WINS
         self.current_player = Player.O if self.current_player == Player.X else Player.X
+        
+        # Only lines through the new piece can have been completed
+        if self._state == GameState.ONGOING:
+            for m in WIN_MASKS_FOR_CELL[cell]:
+                if (mask & m) == m:
+                    self._state = win_state
+                    break
+            else:
+                if (self.x_mask | self.o_mask) == FULL_MASK:
+                    self._state = GameState.DRAW
         return True
     
+    def unmake_move(self, row: int, col: int):
+        """
+        Take back the move at (row, col), making it that player's turn again.
+        
+        Args:
+            row: Row index (0-2) of the last move made
+            col: Column index (0-2) of the last move made
+        """
+        bit = 1 << (row * 3 + col)
+        self.x_mask &= ~bit
+        self.o_mask &= ~bit
+        self.current_player = Player.O if self.current_player == Player.X else Player.X
+        if self._state != GameState.ONGOING:
+            self._state = self._scan_state()
+    
     def is_valid_move(self, row: int, col: int) -> bool:
         """Check if a move is valid."""
         return (0 <= row < 3 and 0 <= col < 3 and 
-                self.board[row][col] is None)
+                not (self.x_mask | self.o_mask) & (1 << (row * 3 + col)))
     
     def get_game_state(self) -> GameState:
         """
-        Check the current game state.
+        Get the current game state.
         
         Returns:
             GameState enum indicating current state
         """
-        # Check rows
-        for row in self.board:
-            if row[0] == row[1] == row[2] and row[0] is not None:
-                return GameState.X_WINS if row[0] == "X" else GameState.O_WINS
-        
-        # Check columns
-        for col in range(3):
-            if (self.board[0][col] == self.board[1][col] == self.board[2][col] 
-                and self.board[0][col] is not None):
-                return GameState.X_WINS if self.board[0][col] == "X" else GameState.O_WINS
-        
-        # Check diagonals
-        if (self.board[0][0] == self.board[1][1] == self.board[2][2] 
-            and self.board[0][0] is not None):
-            return GameState.X_WINS if self.board[0][0] == "X" else GameState.O_WINS
-        
-        if (self.board[0][2] == self.board[1][1] == self.board[2][0] 
-            and self.board[0][2] is not None):
-            return GameState.X_WINS if self.board[0][2] == "X" else GameState.O_WINS
-        
-        # Check for draw
-        if all(cell is not None for row in self.board for cell in row):
+        return self._state
+    
+    def _scan_state(self) -> GameState:
+        """Work out the game state from the bitboards from scratch."""
+        for m in WIN_MASKS:
+            if (self.x_mask & m) == m:
+                return GameState.X_WINS
+            if (self.o_mask & m) == m:
+                return GameState.O_WINS
+        if (self.x_mask | self.o_mask) == FULL_MASK:
             return GameState.DRAW
-        
         return GameState.ONGOING
     
+    def iter_empty_cells(self) -> Iterator[Tuple[int, int]]:
+        """Yield empty cell coordinates without building a list."""
+        occupied = self.x_mask | self.o_mask
+        for i in range(9):
+            if not occupied >> i & 1:
+                yield divmod(i, 3)
+    
     def get_empty_cells(self) -> List[Tuple[int, int]]:
         """Get list of empty cell coordinates."""
-        return [(r, c) for r in range(3) for c in range(3) 
-                if self.board[r][c] is None]
+        return list(self.iter_empty_cells())
     
     def reset(self):
         """Reset the board to initial state."""
-        self.board = [[None for _ in range(3)] for _ in range(3)]
         self.current_player = Player.X
+        self.x_mask = 0
+        self.o_mask = 0
+        self._state = GameState.ONGOING
+    
+    def encode(self) -> int:
+        """Pack the grid into a base-3 integer; see encode_masks."""
+        return encode_masks(self.x_mask, self.o_mask)
     
     def copy(self) -> 'GameBoard':
         """Create a deep copy of the current board state."""
         new_board = GameBoard()
-        new_board.board = [row[:] for row in self.board]
         new_board.current_player = self.current_player
+        new_board.x_mask = self.x_mask
+        new_board.o_mask = self.o_mask
+        new_board._state = self._state
         return new_board
\ No newline at end of file
@@ -18,7 +18,7 @@ def check_flask():
 def install_flask():
     """Install Flask if not present."""
     print("Flask not found. Installing...")
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "Flask>=2.0.0"])
+    subprocess.check_call([sys.executable, "-m", "pip", "install", "Flask>=2.2.0"])
     print("Flask installed successfully!")
 
 def main():
@@ -28,7 +28,7 @@ def main():
             install_flask()
         except subprocess.CalledProcessError:
             print("Failed to install Flask. Please install manually:")
-            print("pip install Flask>=2.0.0")
+            print("pip install Flask>=2.2.0")
             sys.exit(1)
     
     print("🚀 Starting Tic Tac Toe Web Server...")
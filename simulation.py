@@ -0,0 +1,119 @@
+"""
+Batch self-play between AI difficulty levels.
+
+This module plays many AI-vs-AI games at once for evaluating the difficulty
+levels against each other. All boards are held in one NumPy array, so win
+checks and move selection for the whole batch are array operations rather
+than a Python loop per game.
+"""
+
+from typing import Dict, Optional
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from game_logic import LINES, POW3
+from ai_player import Difficulty, load_policy
+
+# Cell values in a batch: X and O pieces, empty is 0
+_X = 1
+_O = -1
+
+if np is not None:
+    _LINES = np.array(LINES)                       # (8, 3) cell indices
+    _LINE_MASKS = np.zeros((len(LINES), 9), dtype=np.int8)
+    _LINE_MASKS[np.arange(len(LINES))[:, None], _LINES] = 1
+    _POW3 = np.array(POW3, dtype=np.int64)         # encode_masks place values
+
+def _random_moves(boards: "np.ndarray", rng: "np.random.Generator") -> "np.ndarray":
+    """Pick a uniformly random empty cell on each board."""
+    scores = rng.random(boards.shape)
+    scores[boards != 0] = -1.0
+    return scores.argmax(axis=1)
+
+
+def _completing_moves(boards: "np.ndarray", side: int):
+    """
+    Find, for each board, a cell that completes a line for side.
+    
+    Returns:
+        (found, cells) arrays; cells is only meaningful where found is True
+    """
+    cells = boards[:, _LINES]                               # (n, 8, 3)
+    hits = (((cells == side).sum(axis=2) == 2)
+            & ((cells == 0).sum(axis=2) == 1))              # (n, 8)
+    empty_cells = _LINES[np.arange(len(LINES)), (cells == 0).argmax(axis=2)]
+    first_hit = hits.argmax(axis=1)
+    return hits.any(axis=1), empty_cells[np.arange(len(boards)), first_hit]
+
+
+def _medium_moves(boards: "np.ndarray", side: int,
+                  rng: "np.random.Generator") -> "np.ndarray":
+    """Apply the medium AI's win, block, center, random order to each board."""
+    moves = _random_moves(boards, rng)
+    moves[boards[:, 4] == 0] = 4
+    can_block, block_cells = _completing_moves(boards, -side)
+    moves[can_block] = block_cells[can_block]
+    can_win, win_cells = _completing_moves(boards, side)
+    moves[can_win] = win_cells[can_win]
+    return moves
+
+
+def _hard_moves(boards: "np.ndarray") -> "np.ndarray":
+    """Look up the precomputed optimal move for each board."""
+    # The same base-3 digits as game_logic.encode_masks: 1 for X, 2 for O
+    digits = np.where(boards == _O, 2, boards).astype(np.int64)
+    codes = digits @ _POW3
+    # A view of the shared policy table; only normal-play positions occur here
+    table = np.frombuffer(load_policy(), dtype=np.uint8, count=3 ** 9)
+    return table[codes].astype(np.int64)
+
+
+def simulate_games(x_difficulty: Difficulty, o_difficulty: Difficulty,
+                   n_games: int, seed: Optional[int] = None) -> Dict[str, int]:
+    """
+    Play a batch of AI-vs-AI games.
+    
+    Args:
+        x_difficulty: Difficulty of the AI playing X (moving first)
+        o_difficulty: Difficulty of the AI playing O
+        n_games: Number of games to play
+        seed: Optional seed for the random moves of easy and medium AIs
+    
+    Returns:
+        Dict with "x_wins", "o_wins" and "draws" counts
+    """
+    if np is None:
+        raise RuntimeError("NumPy is required for batch simulation")
+    
+    rng = np.random.default_rng(seed)
+    
+    boards = np.zeros((n_games, 9), dtype=np.int8)
+    winner = np.zeros(n_games, dtype=np.int8)  # _X, _O, or 0 for none yet
+    
+    for ply in range(9):
+        active = np.flatnonzero(winner == 0)
+        if active.size == 0:
+            break
+        side = _X if ply % 2 == 0 else _O
+        difficulty = x_difficulty if side == _X else o_difficulty
+        
+        batch = boards[active]
+        if difficulty == Difficulty.EASY:
+            moves = _random_moves(batch, rng)
+        elif difficulty == Difficulty.MEDIUM:
+            moves = _medium_moves(batch, side, rng)
+        else:  # HARD
+            moves = _hard_moves(batch)
+        batch[np.arange(active.size), moves] = side
+        boards[active] = batch
+        
+        # A line sums to 3 (or -3) exactly when one side holds all of it
+        won = ((batch @ _LINE_MASKS.T) == 3 * side).any(axis=1)
+        winner[active[won]] = side
+    
+    x_wins = int((winner == _X).sum())
+    o_wins = int((winner == _O).sum())
+    return {"x_wins": x_wins, "o_wins": o_wins, "draws": n_games - x_wins - o_wins}
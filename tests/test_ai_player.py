@@ -3,6 +3,7 @@ Unit tests for ai_player module.
 """
 
 import unittest
+import subprocess
 import sys
 import os
 
@@ -10,7 +11,8 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from game_logic import GameBoard, Player
-from ai_player import AIPlayer, Difficulty
+from ai_player import AIPlayer, Difficulty, _ZMOVE, _zobrist
+from ai_player_core import NUMBA_AVAILABLE, WIN, X, O, has_winning_move, solve
 
 
 class TestAIPlayer(unittest.TestCase):
@@ -33,8 +35,8 @@ class TestAIPlayer(unittest.TestCase):
     def test_medium_ai_wins_when_possible(self):
         """Test that medium AI takes winning moves."""
         # Set up board where O can win
-        self.board.board[0][0] = "O"
-        self.board.board[0][1] = "O"
+        for row, col in [(2, 2), (0, 0), (1, 0), (0, 1)]:
+            self.board.make_move(row, col)
         # O should play (0,2) to win
         
         move = self.ai_medium.get_move(self.board)
@@ -43,8 +45,8 @@ class TestAIPlayer(unittest.TestCase):
     def test_medium_ai_blocks_opponent(self):
         """Test that medium AI blocks opponent wins."""
         # Set up board where X is about to win
-        self.board.board[0][0] = "X"
-        self.board.board[0][1] = "X"
+        for row, col in [(0, 0), (2, 2), (0, 1)]:
+            self.board.make_move(row, col)
         # O should block at (0,2)
         
         move = self.ai_medium.get_move(self.board)
@@ -77,11 +79,61 @@ class TestAIPlayer(unittest.TestCase):
         final_state = board.get_game_state()
         self.assertNotEqual(final_state.value, "x_wins")
     
+    def test_hard_ai_blocks_opponent(self):
+        """Test that hard AI blocks the only losing line."""
+        for row, col in [(2, 0), (1, 1), (2, 1)]:
+            self.board.make_move(row, col)
+        # X threatens (2,2); every other move loses
+        
+        move = self.ai_hard.get_move(self.board)
+        self.assertEqual(move, (2, 2))
+    
+    def test_core_solve(self):
+        """Test the bitboard search core on solved positions."""
+        self.assertEqual(solve(0, 0, X, -WIN - 1, WIN + 1), 0)  # Empty board draws
+        # X on (0,0) and (0,1), O on (1,0) and (1,1): X to move wins
+        self.assertEqual(solve(0b000000011, 0b000011000, X, -WIN - 1, WIN + 1), WIN)
+        # Same position with O to move: O wins first
+        self.assertEqual(solve(0b000000011, 0b000011000, O, -WIN - 1, WIN + 1), WIN)
+    
+    @unittest.skipUnless(NUMBA_AVAILABLE, "Numba is not installed")
+    def test_core_solve_in_fresh_processes(self):
+        """Test that the compiled solver runs in each new process."""
+        repo = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        code = "from ai_player_core import solve, X; print(solve(0, 0, X, -11, 11))"
+        for _ in range(2):
+            result = subprocess.run([sys.executable, "-c", code], cwd=repo,
+                                    capture_output=True, text=True, timeout=120)
+            self.assertEqual(result.returncode, 0, result.stderr)
+            self.assertEqual(result.stdout.strip(), "0")
+    
+    def test_core_has_winning_move(self):
+        """Test detection of a line that one move completes."""
+        empty = 0b111111100
+        self.assertTrue(has_winning_move(0b000000011, empty))
+        self.assertFalse(has_winning_move(0b000000011, empty & ~0b000000100))
+        self.assertFalse(has_winning_move(0b000000001, empty))
+    
+    def test_zobrist_incremental_update(self):
+        """Test that per-move hash updates match hashing from scratch."""
+        zhashes = _zobrist(0, 0, X)
+        for side, bit in [(X, 1 << 4), (O, 1 << 0)]:  # X center, O corner
+            zhashes = tuple(h ^ d for h, d in zip(zhashes, _ZMOVE[side][bit]))
+        self.assertEqual(zhashes, _zobrist(1 << 4, 1 << 0, X))
+        self.assertNotEqual(zhashes, _zobrist(1 << 4, 1 << 0, O))
+    
+    def test_zobrist_symmetric_positions_share_key(self):
+        """Test that rotations and reflections hash to the same table key."""
+        corners = [1 << 0, 1 << 2, 1 << 6, 1 << 8]
+        keys = {min(_zobrist(1 << 4, corner, X)) for corner in corners}
+        self.assertEqual(len(keys), 1)
+        self.assertNotEqual(min(_zobrist(1 << 4, 1 << 1, X)), keys.pop())
+    
     def test_find_winning_move(self):
         """Test the _find_winning_move method."""
         # Set up a winning scenario
-        self.board.board[0][0] = "O"
-        self.board.board[0][1] = "O"
+        for row, col in [(2, 2), (0, 0), (1, 0), (0, 1)]:
+            self.board.make_move(row, col)
         
         winning_move = self.ai_medium._find_winning_move(self.board, "O")
         self.assertEqual(winning_move, (0, 2))
@@ -31,6 +31,16 @@ class TestGameBoard(unittest.TestCase):
         self.assertEqual(self.board.board[0][0], "X")
         self.assertEqual(self.board.current_player, Player.O)
     
+    def test_bitboards_follow_moves(self):
+        """Test that the bitboards track the grid."""
+        self.board.make_move(0, 0)  # X
+        self.board.make_move(2, 1)  # O
+        self.assertEqual(self.board.x_mask, 1 << 0)
+        self.assertEqual(self.board.o_mask, 1 << 7)
+        
+        self.board.unmake_move(2, 1)
+        self.assertEqual(self.board.o_mask, 0)
+    
     def test_invalid_move(self):
         """Test invalid moves."""
         self.board.make_move(0, 0)
@@ -38,6 +48,26 @@ class TestGameBoard(unittest.TestCase):
         self.assertFalse(self.board.make_move(-1, 0))  # Out of bounds
         self.assertFalse(self.board.make_move(3, 0))   # Out of bounds
     
+    def test_unmake_move(self):
+        """Test taking back a move."""
+        self.board.make_move(0, 0)
+        self.board.make_move(1, 1)
+        self.board.unmake_move(1, 1)
+        
+        self.assertIsNone(self.board.board[1][1])
+        self.assertEqual(self.board.board[0][0], "X")
+        self.assertEqual(self.board.current_player, Player.O)
+    
+    def test_unmake_winning_move(self):
+        """Test that taking back a winning move reopens the game."""
+        for row, col in [(0, 0), (1, 0), (0, 1), (1, 1), (0, 2)]:
+            self.board.make_move(row, col)
+        self.assertEqual(self.board.get_game_state(), GameState.X_WINS)
+        
+        self.board.unmake_move(0, 2)
+        self.assertEqual(self.board.get_game_state(), GameState.ONGOING)
+        self.assertEqual(self.board.current_player, Player.X)
+    
     def test_win_conditions(self):
         """Test various win conditions."""
         # Test row win
@@ -48,6 +78,33 @@ class TestGameBoard(unittest.TestCase):
         self.board.make_move(0, 2)  # X wins
         self.assertEqual(self.board.get_game_state(), GameState.X_WINS)
     
+    def test_column_and_diagonal_wins(self):
+        """Test column and diagonal win conditions."""
+        for row, col in [(0, 2), (0, 0), (1, 2), (1, 1), (2, 2)]:
+            self.board.make_move(row, col)  # X completes column 2
+        self.assertEqual(self.board.get_game_state(), GameState.X_WINS)
+        
+        self.board.reset()
+        for row, col in [(0, 0), (0, 2), (0, 1), (1, 1), (2, 2), (2, 0)]:
+            self.board.make_move(row, col)  # O completes the anti-diagonal
+        self.assertEqual(self.board.get_game_state(), GameState.O_WINS)
+    
+    def test_board_is_read_only(self):
+        """Test that the grid cannot be changed behind the cached game state."""
+        with self.assertRaises(TypeError):
+            self.board.board[0] = ["X", "X", "X"]
+        with self.assertRaises(TypeError):
+            self.board.board[0][0] = "X"
+        with self.assertRaises(AttributeError):
+            self.board.board = [["X", "X", "X"], [None] * 3, [None] * 3]
+        self.assertEqual(self.board.get_game_state(), GameState.ONGOING)
+        
+        for row, col in [(0, 0), (1, 0), (0, 1), (1, 1), (0, 2)]:
+            self.board.make_move(row, col)
+        self.assertEqual(self.board.board[0], ("X", "X", "X"))
+        self.assertEqual(self.board.get_game_state(), GameState.X_WINS)
+        self.assertEqual(self.board.copy().get_game_state(), GameState.X_WINS)
+    
     def test_draw_condition(self):
         """Test draw condition."""
         moves = [(0,0), (0,1), (0,2), (1,1), (1,0), (1,2), (2,1), (2,0), (2,2)]
@@ -67,6 +124,13 @@ class TestGameBoard(unittest.TestCase):
         copied_board.make_move(1, 1)
         self.assertIsNone(self.board.board[1][1])
     
+    def test_encode(self):
+        """Test packing a board into its base-3 encoding."""
+        self.assertEqual(self.board.encode(), 0)
+        for row, col in [(1, 1), (0, 0), (2, 1)]:
+            self.board.make_move(row, col)
+        self.assertEqual(self.board.encode(), 3 ** 4 + 2 * 3 ** 0 + 3 ** 7)
+    
     def test_reset(self):
         """Test board reset."""
         self.board.make_move(0, 0)
@@ -0,0 +1,41 @@
+"""
+Unit tests for simulation module.
+"""
+
+import unittest
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai_player import Difficulty
+from simulation import np, simulate_games
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestSimulateGames(unittest.TestCase):
+    """Test cases for simulate_games."""
+    
+    def test_results_add_up(self):
+        """Test that every game is counted exactly once."""
+        results = simulate_games(Difficulty.EASY, Difficulty.EASY, 500, seed=1)
+        self.assertEqual(sum(results.values()), 500)
+        self.assertGreater(results["x_wins"], 0)
+        self.assertGreater(results["o_wins"], 0)
+    
+    def test_hard_ai_never_loses(self):
+        """Test that hard AI never loses from either side."""
+        results = simulate_games(Difficulty.EASY, Difficulty.HARD, 500, seed=2)
+        self.assertEqual(results["x_wins"], 0)
+        results = simulate_games(Difficulty.HARD, Difficulty.EASY, 500, seed=3)
+        self.assertEqual(results["o_wins"], 0)
+    
+    def test_hard_vs_hard_draws(self):
+        """Test that perfect play always ends in a draw."""
+        results = simulate_games(Difficulty.HARD, Difficulty.HARD, 10)
+        self.assertEqual(results["draws"], 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
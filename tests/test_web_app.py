@@ -0,0 +1,94 @@
+"""
+Unit tests for web_app module.
+"""
+
+import unittest
+from unittest import mock
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    import web_app
+except ImportError:  # Flask is not installed
+    web_app = None
+
+
+@unittest.skipIf(web_app is None, "Flask is not installed")
+class TestWebApp(unittest.TestCase):
+    """Test cases for the web app endpoints."""
+    
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        web_app.games.clear()
+        self.client = web_app.app.test_client()
+    
+    def new_game(self, **options):
+        """Start a game and return its id."""
+        response = self.client.post('/new_game', json=options)
+        self.assertEqual(response.status_code, 200)
+        return response.get_json()['game_id']
+    
+    def test_ai_game(self):
+        """Test that a move in AI mode gets the AI's reply."""
+        game_id = self.new_game(mode='ai', difficulty='hard')
+        response = self.client.post('/make_move', json={'game_id': game_id, 'row': 1, 'col': 1})
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()
+        self.assertEqual(data['current_player'], 'X')
+        row, col = data['ai_move']
+        self.assertEqual(data['board'][row][col], 'O')
+    
+    def test_rejects_malformed_requests(self):
+        """Test that malformed bodies and fields get a 400, not a 500."""
+        for body in [b'not json', b'[1, 2]', b'"game"']:
+            for url in ['/new_game', '/make_move', '/simulate']:
+                response = self.client.post(url, data=body, content_type='application/json')
+                self.assertEqual(response.status_code, 400, (url, body))
+        
+        for options in [{'mode': 'online'}, {'mode': ['ai']},
+                        {'mode': 'ai', 'difficulty': 'expert'},
+                        {'mode': 'ai', 'difficulty': ['hard']}]:
+            response = self.client.post('/new_game', json=options)
+            self.assertEqual(response.status_code, 400, options)
+    
+    def test_rejects_invalid_moves(self):
+        """Test that make_move validates game_id, row and col."""
+        game_id = self.new_game()
+        for move in [{'game_id': 1, 'row': 0, 'col': 0},
+                     {'row': 0, 'col': 0},
+                     {'game_id': game_id, 'row': True, 'col': 0},
+                     {'game_id': game_id, 'row': 0.0, 'col': 0},
+                     {'game_id': game_id, 'row': '0', 'col': 0},
+                     {'game_id': game_id, 'row': 0, 'col': 3},
+                     {'game_id': game_id, 'row': -1, 'col': 0}]:
+            response = self.client.post('/make_move', json=move)
+            self.assertEqual(response.status_code, 400, move)
+        
+        response = self.client.post('/make_move', json={'game_id': 'missing', 'row': 0, 'col': 0})
+        self.assertEqual(response.status_code, 404)
+        
+        # The game is untouched and still accepts a real move
+        response = self.client.post('/make_move', json={'game_id': game_id, 'row': 0, 'col': 0})
+        self.assertEqual(response.status_code, 200)
+        response = self.client.post('/make_move', json={'game_id': game_id, 'row': 0, 'col': 0})
+        self.assertEqual(response.status_code, 400)
+    
+    def test_evicts_least_recently_used_game(self):
+        """Test that the oldest untouched game is dropped at MAX_GAMES."""
+        with mock.patch.object(web_app, 'MAX_GAMES', 2):
+            first = self.new_game()
+            second = self.new_game()
+            # Playing in the first game makes the second the least recent
+            self.client.post('/make_move', json={'game_id': first, 'row': 0, 'col': 0})
+            third = self.new_game()
+        
+        self.assertEqual(list(web_app.games), [first, third])
+        response = self.client.post('/make_move', json={'game_id': second, 'row': 0, 'col': 0})
+        self.assertEqual(response.status_code, 404)
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -2,16 +2,84 @@
 Web-based Tic Tac Toe game using Flask.
 """
 
+import os
+from collections import OrderedDict
 from flask import Flask, render_template, request, jsonify, session
-import uuid
+from flask.json.provider import DefaultJSONProvider
+import secrets
+import threading
 from game_logic import GameBoard, GameState, Player
-from ai_player import AIPlayer, Difficulty
+from ai_player import AIPlayer, Difficulty, load_policy
+from simulation import np, simulate_games
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that encodes and decodes with orjson."""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 
 app = Flask(__name__)
 app.secret_key = 'tic-tac-toe-secret-key'
+# Use the faster orjson for jsonify/request.json when it is installed
+if orjson is not None:
+    app.json = OrjsonProvider(app)
+
+# Map (or build) the hard AI's precomputed move table at import, so requests
+# only do table lookups
+load_policy()
+
+# Request difficulty names, and the side the AI plays in 'ai' mode
+_DIFFICULTY_MAP = {
+    'easy': Difficulty.EASY,
+    'medium': Difficulty.MEDIUM,
+    'hard': Difficulty.HARD
+}
+_AI_PLAYER = Player.O
+
+# Upper bound on games per /simulate request
+MAX_SIMULATED_GAMES = 100_000
+
+# Store game sessions, least recently used first; the oldest are dropped once
+# MAX_GAMES is reached so abandoned games do not accumulate forever
+MAX_GAMES = 10_000
+games = OrderedDict()
+# Guards the games dict itself; each game also has its own lock for moves
+_games_lock = threading.Lock()
+
+def _read_json():
+    """
+    Parse the request body as a JSON object, bypassing Flask's request cache.
+    
+    Returns:
+        The decoded dict ({} for an empty body), or None if the body is not
+        a JSON object
+    """
+    body = request.get_data(cache=False)
+    if not body:
+        return {}
+    try:
+        data = app.json.loads(body)
+    except ValueError:
+        return None
+    return data if isinstance(data, dict) else None
+
+def _parse_difficulty(name):
+    """Map a request difficulty name to a Difficulty, or None if it is not one."""
+    return _DIFFICULTY_MAP.get(name) if isinstance(name, str) else None
 
-# Store game sessions
-games = {}
+def _is_cell_index(value) -> bool:
+    """Check that value is an int row/column index (bools are not)."""
+    return type(value) is int and 0 <= value < 3
 
 @app.route('/')
 def index():
@@ -20,27 +88,33 @@ def index():
 
 @app.route('/new_game', methods=['POST'])
 def new_game():
-    """Start a new game."""
-    data = request.json
-    game_id = str(uuid.uuid4())
+    """Start a new game. The returned game_id is an opaque URL-safe token."""
+    data = _read_json()
+    if data is None:
+        return jsonify({'error': 'Request body must be a JSON object'}), 400
+    mode = data.get('mode', 'human')
+    if mode not in ('ai', 'human'):
+        return jsonify({'error': 'Unknown mode'}), 400
     
+    game_id = secrets.token_urlsafe(16)
     board = GameBoard()
     ai_player = None
     
-    if data.get('mode') == 'ai':
-        difficulty_map = {
-            'easy': Difficulty.EASY,
-            'medium': Difficulty.MEDIUM,
-            'hard': Difficulty.HARD
-        }
-        difficulty = difficulty_map[data.get('difficulty', 'easy')]
-        ai_player = AIPlayer(difficulty, Player.O)
+    if mode == 'ai':
+        difficulty = _parse_difficulty(data.get('difficulty', 'easy'))
+        if difficulty is None:
+            return jsonify({'error': 'Unknown difficulty'}), 400
+        ai_player = AIPlayer(difficulty, _AI_PLAYER)
     
-    games[game_id] = {
-        'board': board,
-        'ai_player': ai_player,
-        'mode': data.get('mode', 'human')
-    }
+    with _games_lock:
+        games[game_id] = {
+            'board': board,
+            'ai_player': ai_player,
+            'mode': mode,
+            'lock': threading.Lock()
+        }
+        while len(games) > MAX_GAMES:
+            games.popitem(last=False)
     
     return jsonify({
         'game_id': game_id,
@@ -52,42 +126,91 @@ def new_game():
 @app.route('/make_move', methods=['POST'])
 def make_move():
     """Make a move in the game."""
-    data = request.json
-    game_id = data['game_id']
-    row, col = data['row'], data['col']
-    
-    if game_id not in games:
-        return jsonify({'error': 'Game not found'}), 404
+    data = _read_json()
+    if data is None:
+        return jsonify({'error': 'Request body must be a JSON object'}), 400
+    game_id = data.get('game_id')
+    row, col = data.get('row'), data.get('col')
+    if not isinstance(game_id, str):
+        return jsonify({'error': 'game_id must be a string'}), 400
+    # Fail fast on anything but in-range ints, before touching the store
+    if not (_is_cell_index(row) and _is_cell_index(col)):
+        return jsonify({'error': 'Invalid move'}), 400
     
-    game = games[game_id]
-    board = game['board']
+    with _games_lock:
+        game = games.get(game_id)
+        if game is None:
+            return jsonify({'error': 'Game not found'}), 404
+        games.move_to_end(game_id)
     
-    # Make human move
-    if not board.make_move(row, col):
+    # Reject out-of-range or occupied cells without waiting for the game lock;
+    # make_move below re-checks under the lock in case of a concurrent move
+    if not game['board'].is_valid_move(row, col):
         return jsonify({'error': 'Invalid move'}), 400
     
-    response = {
-        'board': board.board,
-        'current_player': board.current_player.value,
-        'game_state': board.get_game_state().value
-    }
-    
-    # Make AI move if needed
-    if (game['mode'] == 'ai' and 
-        board.get_game_state() == GameState.ONGOING and 
-        board.current_player == Player.O):
+    # Moves on one game are serialized; other games proceed in parallel
+    with game['lock']:
+        board = game['board']
+        
+        # Make human move
+        if not board.make_move(row, col):
+            return jsonify({'error': 'Invalid move'}), 400
         
-        ai_move = game['ai_player'].get_move(board)
-        board.make_move(ai_move[0], ai_move[1])
+        # Read the turn and state once per move and reuse them below
+        cur = board.current_player
+        state = board.get_game_state()
         
-        response.update({
-            'ai_move': ai_move,
-            'board': board.board,
-            'current_player': board.current_player.value,
-            'game_state': board.get_game_state().value
-        })
+        # Make AI move if needed
+        if (game['mode'] == 'ai' and 
+            state == GameState.ONGOING and 
+            cur == _AI_PLAYER):
+            
+            ai_move = game['ai_player'].get_move(board)
+            board.make_move(ai_move[0], ai_move[1])
+            cur = board.current_player
+            state = board.get_game_state()
+            response = {
+                'ai_move': ai_move,
+                'board': board.board,
+                'current_player': cur.value,
+                'game_state': state.value
+            }
+        else:
+            response = {
+                'board': board.board,
+                'current_player': cur.value,
+                'game_state': state.value
+            }
     
+    # board.board is a snapshot, so the response can be serialized unlocked
     return jsonify(response)
 
+@app.route('/simulate', methods=['POST'])
+def simulate():
+    """Play a batch of AI-vs-AI games and report the results."""
+    if np is None:
+        return jsonify({'error': 'NumPy is required for simulation'}), 501
+    
+    data = _read_json()
+    if data is None:
+        return jsonify({'error': 'Request body must be a JSON object'}), 400
+    x_difficulty = _parse_difficulty(data.get('x_difficulty', 'hard'))
+    o_difficulty = _parse_difficulty(data.get('o_difficulty', 'hard'))
+    if x_difficulty is None or o_difficulty is None:
+        return jsonify({'error': 'Unknown difficulty'}), 400
+    n_games = data.get('games', 1000)
+    if type(n_games) is not int or not 0 < n_games <= MAX_SIMULATED_GAMES:
+        return jsonify({'error': f'games must be between 1 and {MAX_SIMULATED_GAMES}'}), 400
+    
+    results = simulate_games(x_difficulty, o_difficulty, n_games)
+    results['games'] = n_games
+    return jsonify(results)
+
 if __name__ == '__main__':
-    app.run(host='localhost', port=3000, debug=True)
\ No newline at end of file
+    # Development server only; set FLASK_DEBUG=1 for the debugger and
+    # reloader. In production run under gunicorn instead, e.g.
+    #   gunicorn --workers 1 --threads 8 --bind 0.0.0.0:3000 web_app:app
+    # Games live in this process's memory, so scale with threads rather
+    # than worker processes.
+    app.run(host='localhost', port=3000,
+            debug=os.environ.get('FLASK_DEBUG') == '1')
\ No newline at end of file